@@ -2,9 +2,16 @@
 color_utils.py
 Pure color space conversions, ND-safe, offline.
 All functions are small and side-effect free.
+The *_batch variants convert whole NumPy arrays at once and need numpy;
+the scalar functions stay dependency-free.
 """
 
-from typing import Tuple
+from typing import Any, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only the batch helpers use it
+    np = None
 
 
 def clamp(value: float, low: float = 0.0, high: float = 1.0) -> float:
@@ -23,21 +30,63 @@ def ycocg_to_rgb(y: float, co: float, cg: float) -> Tuple[float, float, float]:
 def ycocg_to_hsl(y: float, co: float, cg: float) -> Tuple[float, float, float]:
     """Convert yCoCg to HSL while preserving luminance."""
     r, g, b = ycocg_to_rgb(y, co, cg)
-    max_c = max(r, g, b)
-    min_c = min(r, g, b)
+    max_c = r if r >= g and r >= b else (g if g >= b else b)
+    min_c = r if r <= g and r <= b else (g if g <= b else b)
     delta = max_c - min_c
-
+    l = y if 0.0 <= y <= 1.0 else clamp(y)
     if delta == 0:
-        h = 0.0
-    elif max_c == r:
+        return 0.0, 0.0, l
+
+    if max_c == r:
         h = ((g - b) / delta) % 6
     elif max_c == g:
         h = (b - r) / delta + 2
     else:
         h = (r - g) / delta + 4
-    h /= 6
 
-    l = clamp(y)
     denom = 1 - abs(2 * l - 1)
-    s = 0.0 if delta == 0 or denom == 0 else clamp(delta / denom)
+    if denom == 0:
+        s = 0.0
+    else:
+        # delta / denom is already >= 0, so only the upper bound can clip
+        s = delta / denom if delta <= denom else 1.0
+    return h / 6, s, l
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("numpy is required for the *_batch color conversions")
+
+
+def ycocg_to_rgb_batch(y: Any, co: Any, cg: Any) -> Tuple[Any, Any, Any]:
+    """Vectorised ycocg_to_rgb over array-likes; returns float arrays r, g, b."""
+    _require_numpy()
+    y = np.asarray(y, dtype=np.float64)
+    co = np.asarray(co, dtype=np.float64)
+    cg = np.asarray(cg, dtype=np.float64)
+    r = np.clip(y + co - cg, 0.0, 1.0)
+    g = np.clip(y + cg, 0.0, 1.0)
+    b = np.clip(y - co - cg, 0.0, 1.0)
+    return r, g, b
+
+
+def ycocg_to_hsl_batch(y: Any, co: Any, cg: Any) -> Tuple[Any, Any, Any]:
+    """Vectorised ycocg_to_hsl; hue picks its sector with np.select, no per-pixel branches."""
+    r, g, b = ycocg_to_rgb_batch(y, co, cg)
+    max_c = np.maximum(np.maximum(r, g), b)
+    min_c = np.minimum(np.minimum(r, g), b)
+    delta = max_c - min_c
+    flat = delta == 0
+    safe = np.where(flat, 1.0, delta)
+
+    h = np.select(
+        [flat, max_c == r, max_c == g],
+        [0.0, ((g - b) / safe) % 6, (b - r) / safe + 2],
+        default=(r - g) / safe + 4,
+    ) / 6
+
+    l = np.clip(y, 0.0, 1.0)
+    denom = 1 - np.abs(2 * l - 1)
+    zero = flat | (denom == 0)
+    s = np.where(zero, 0.0, np.clip(delta / np.where(zero, 1.0, denom), 0.0, 1.0))
     return h, s, l
@@ -5,48 +5,151 @@ ND-safe: plain text output, no network, deterministic.
 Use --fix to remove duplicates in-place.
 """
 
+import os
+import stat
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from itertools import accumulate, compress, count, islice, repeat, tee
+from operator import eq
 from pathlib import Path
 
 # watch simple text formats only
 TEXT_EXT = {".js", ".mjs", ".html", ".json", ".md", ".py", ".txt"}
 SKIP = {".git", "node_modules", "__pycache__"}
+# str.endswith takes a tuple and tests every suffix in C
+_TEXT_SUFFIXES = tuple(TEXT_EXT)
+_SKIP = frozenset(SKIP)
+
+def _scan(dir_path):
+    """Recurse with os.scandir; excluded dirs are pruned before descent.
+
+    Unreadable directories are skipped, as Path.rglob did.
+    """
+    try:
+        it = os.scandir(dir_path)
+    except PermissionError:
+        return
+    with it:
+        for entry in it:
+            name = entry.name
+            if name in _SKIP:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan(entry.path)
+            elif name.endswith(_TEXT_SUFFIXES) and entry.is_file(follow_symlinks=False):
+                yield entry
 
 def iter_text_files(root):
-    """Yield text files under root, skipping excluded dirs."""
-    for path in Path(root).rglob("*"):
-        if path.is_file() and path.suffix in TEXT_EXT and not any(part in SKIP for part in path.parts):
-            yield path
+    """Yield DirEntry objects for text files under root, skipping excluded dirs."""
+    yield from _scan(root)
+
+def _write_atomic(path, data):
+    """Write bytes to a sibling temp file in one os.write, then swap it over path."""
+    path = os.fspath(path)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".dedup-")
+    try:
+        os.fchmod(fd, stat.S_IMODE(os.stat(path).st_mode))
+        view = memoryview(data)
+        while view:  # a regular file takes it all at once; loop only for short writes
+            view = view[os.write(fd, view):]
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp)
+        raise
+    os.close(fd)
+    os.replace(tmp, path)
+
+def _lf_repeats(data):
+    """Yield (index, start) for each line of LF-only data equal to its predecessor.
+
+    Lines stream out of a BytesIO over data, so only a couple are alive at a
+    time; splitting, comparing and offset sums all run in C.
+    """
+    raw_it, len_it = tee(BytesIO(data))
+    # running totals of raw line lengths (LF included) are the next line's start
+    starts = accumulate(map(len, len_it))
+    prev_it, line_it = tee(map(bytes.rstrip, raw_it, repeat(b"\n")))
+    next(line_it, None)
+    return compress(zip(count(1), starts), map(eq, line_it, prev_it))
+
+def _keep_ranges(spans, size):
+    """Byte ranges of data that survive removing the sorted (start, end) spans."""
+    ranges = []
+    pos = 0
+    for start, end in spans:
+        if start > pos:
+            ranges.append((pos, start))
+        pos = end
+    if pos < size:
+        ranges.append((pos, size))
+    return ranges
 
 def dedup_file(path, fix=False):
-    """Return list of (line_no, text) duplicates; remove if fix."""
-    lines = path.read_text(encoding="utf-8").splitlines()
-    new_lines = []
+    """Return list of (line_no, text) duplicates; remove if fix.
+
+    path may be a str or Path. Lines are compared as raw bytes and only
+    decoded when reported; with fix, the surviving byte ranges are copied
+    straight from the original buffer into one output buffer. Only LF, CR
+    and CRLF end a line: VT, FF, U+2028 and the other separators that
+    str.splitlines honours stay inside the line, so --fix never turns them
+    into real newlines.
+
+    LF-only files are scanned lazily, so peak memory stays near the file
+    size. Files containing CR are split into a full line list instead,
+    which costs roughly another copy of the file per line object; --fix
+    rewrites those with LF endings, as the original rewrite did.
+    """
+    with open(path, "rb") as handle:
+        data = handle.read()
     dups = []
-    prev = None
-    for no, line in enumerate(lines, 1):
-        if line == prev and line.strip():
-            dups.append((no, line))
-            if not fix:
-                new_lines.append(line)
-        else:
-            new_lines.append(line)
-        prev = line
+    if b"\r" in data:
+        lines = data.splitlines()
+        # indices of lines equal to their predecessor; the comparisons run in C
+        for index in compress(count(1), map(eq, islice(lines, 1, None), lines)):
+            text = lines[index].decode("utf-8", "replace")
+            if text.strip():
+                dups.append((index + 1, text))
+        if fix and dups:
+            dropped = {no - 1 for no, _ in dups}
+            kept = [line for index, line in enumerate(lines) if index not in dropped]
+            _write_atomic(path, b"\n".join(kept) + b"\n")
+        return dups
+    size = len(data)
+    spans = []
+    for index, start in _lf_repeats(data):
+        end = data.find(b"\n", start)
+        if end < 0:
+            end = size
+        text = data[start:end].decode("utf-8", "replace")
+        if text.strip():
+            dups.append((index + 1, text))
+            spans.append((start, min(end + 1, size)))
     if fix and dups:
-        path.write_text("\n".join(new_lines) + "\n", encoding="utf-8")
+        view = memoryview(data)
+        ranges = _keep_ranges(spans, size)
+        chunks = [view[a:b] for a, b in ranges]
+        if data[ranges[-1][1] - 1] != 0x0A:  # keep the trailing newline the old rewrite added
+            chunks.append(b"\n")
+        _write_atomic(path, b"".join(chunks))
     return dups
 
 def main():
     fix = "--fix" in sys.argv
     root = Path(__file__).resolve().parents[1]
     any_dups = False
-    for file in iter_text_files(root):
-        dups = dedup_file(file, fix)
-        if dups:
-            any_dups = True
-            print(f"{file}:")
-            for no, text in dups:
-                print(f"  dup line {no}: {text}")
+    # sorted for deterministic output; map() yields results in that order, so
+    # each file's report is printed contiguously from the main thread
+    files = sorted(entry.path for entry in iter_text_files(root))
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for file, dups in zip(files, pool.map(lambda file: dedup_file(file, fix), files)):
+            if dups:
+                any_dups = True
+                print(f"{file}:")
+                for no, text in dups:
+                    print(f"  dup line {no}: {text}")
     if not any_dups:
         print("No duplicate lines found.")
 
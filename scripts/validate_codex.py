@@ -3,7 +3,9 @@
 
 Checks that dist/codex.min.json exists, loads the node schema, validates each
 node object, and enforces ND-safe timing rules (minSweepSec >= 14 whenever
-motionOptIn is true). Designed for offline use with no extra dependencies.
+motionOptIn is true). Designed for offline use with no extra dependencies;
+orjson is used for parsing when it happens to be installed, and ijson lets
+large bundles be validated one node at a time.
 """
 
 from __future__ import annotations
@@ -11,108 +13,402 @@ from __future__ import annotations
 import json
 import re
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Sequence
+from typing import IO, Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the baseline
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; without it bundles are parsed in one go
+    ijson = None
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_DATA_PATH = REPO_ROOT / "dist" / "codex.min.json"
 DEFAULT_SCHEMA_PATH = REPO_ROOT / "schema" / "codex-node.schema.json"
+# Bundles at least this large are streamed node by node when ijson is present;
+# below it a single parse is faster and memory is not a concern.
+STREAM_THRESHOLD_BYTES = 32 * 1024 * 1024
+# Nodes per task handed to a worker process when --jobs is above 1.
+CHUNK_SIZE = 1024
+USAGE = "Usage: python scripts/validate_codex.py [--jobs N] [data_path] [schema_path]"
 
 TypeName = str
+# A location is built while recursing as nested (parent, segment) pairs, e.g.
+# (("node", 2), "slug"), and only rendered to "node[2].slug" when reported.
+PathChain = Union[str, Tuple["PathChain", Union[str, int]]]
+
+
+def render_path(chain: PathChain) -> str:
+    segments: List[str] = []
+    while not isinstance(chain, str):
+        chain, segment = chain
+        segments.append(f"[{segment}]" if isinstance(segment, int) else f".{segment}")
+    segments.append(chain)
+    return "".join(reversed(segments))
+
 
 @dataclass
 class ValidationIssue:
-    path: str
+    path_chain: PathChain
     message: str
 
+    @property
+    def path(self) -> str:
+        return render_path(self.path_chain)
+
+
+# Validators append to the issue list; passing None instead selects flag mode,
+# where the first failure raises _Invalid before any message is formatted.
+Issues = Optional[List[ValidationIssue]]
+Validator = Callable[[Any, PathChain, Issues], None]
+
+
+class _Invalid(Exception):
+    """Raised by flag-mode validation on the first failure."""
+
 
 def load_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# JSON decoders only ever produce these exact builtin types, so checks compare
+# type(value) against a set instead of walking isinstance/MRO chains. That also
+# keeps bool (an int subclass) out of integer/number without a separate test.
+_JSON_TYPES: Dict[TypeName, FrozenSet[type]] = {
+    "object": frozenset({dict}),
+    "array": frozenset({list}),
+    "string": frozenset({str}),
+    "integer": frozenset({int}),
+    "number": frozenset({int, float}),
+    "boolean": frozenset({bool}),
+    "null": frozenset({type(None)}),
+}
+_NUMBER_TYPES = _JSON_TYPES["number"]
+
+
+def _resolve_types(expected: Sequence[str]) -> FrozenSet[type]:
+    return frozenset(t for kind in expected for t in _JSON_TYPES.get(kind, ()))
+
+
+def _expected_types(type_decl: Any) -> List[TypeName]:
+    if not type_decl:
+        return []
+    return [type_decl] if isinstance(type_decl, str) else list(type_decl)
+
+
+# Keywords that make a schema more than a bare type check.
+_CONSTRAINT_KEYS = frozenset(
+    {"enum", "pattern", "minimum", "exclusiveMinimum", "required", "properties", "additionalProperties", "minItems", "items"}
+)
+
+
+def _leaf_types(schema: Dict[str, Any]) -> Optional[Tuple[FrozenSet[type], List[TypeName]]]:
+    """Return (types, expected) when schema only declares a type, else None.
+
+    Such leaves are checked inline by the parent instead of through a nested
+    validator call.
+    """
+    expected = _expected_types(schema.get("type"))
+    if not expected or not _CONSTRAINT_KEYS.isdisjoint(schema):
+        return None
+    return _resolve_types(expected), expected
+
+
+def _type_issue(path: PathChain, expected: List[TypeName], value: Any) -> ValidationIssue:
+    return ValidationIssue(path, f"expected type {expected}, received {type(value).__name__}")
+
+
+_cached_types = lru_cache(maxsize=None)(_resolve_types)
 
 
 def type_matches(value: Any, expected: Sequence[str]) -> bool:
-    for kind in expected:
-        if kind == "object" and isinstance(value, dict):
-            return True
-        if kind == "array" and isinstance(value, list):
-            return True
-        if kind == "string" and isinstance(value, str):
-            return True
-        if kind == "integer" and isinstance(value, int) and not isinstance(value, bool):
-            return True
-        if kind == "number" and isinstance(value, (int, float)) and not isinstance(value, bool):
-            return True
-        if kind == "boolean" and isinstance(value, bool):
-            return True
-        if kind == "null" and value is None:
-            return True
-    return False
-
-
-def validate_schema(value: Any, schema: Dict[str, Any], path: str = "$") -> List[ValidationIssue]:
-    issues: List[ValidationIssue] = []
+    # compiled validators resolve their types once; this ad-hoc helper caches per declaration
+    return type(value) in _cached_types(tuple(expected))
+
+
+def compile_schema(schema: Dict[str, Any], extra_checks: Sequence[Validator] = ()) -> Validator:
+    """Compile a schema dict into a single validator closure.
+
+    The schema is inspected once here; the returned ``validate(value, path,
+    issues)`` only runs the checks this schema actually declares and appends
+    any problems to ``issues`` (or raises _Invalid when ``issues`` is None).
+    ``extra_checks`` run last, after the value has passed its type check.
+    """
+    checks: List[Validator] = []
     type_decl = schema.get("type")
-    if type_decl:
-        expected = [type_decl] if isinstance(type_decl, str) else list(type_decl)
-        if not type_matches(value, expected):
-            issues.append(ValidationIssue(path, f"expected type {expected}, received {type(value).__name__}"))
-            return issues
+    expected = _expected_types(type_decl)
+    types = _resolve_types(expected)
+
+    if "enum" in schema:
+        allowed_values = schema["enum"]
+
+        def _check_enum(value: Any, path: PathChain, issues: Issues) -> None:
+            if value not in allowed_values:
+                if issues is None:
+                    raise _Invalid
+                issues.append(ValidationIssue(path, f"expected one of {allowed_values}, received {value!r}"))
+
+        checks.append(_check_enum)
+
+    if "pattern" in schema:
+        pattern_text = schema["pattern"]
+        search = re.compile(pattern_text).search
+
+        def _check_pattern(value: Any, path: PathChain, issues: Issues) -> None:
+            if type(value) is str and not search(value):
+                if issues is None:
+                    raise _Invalid
+                issues.append(ValidationIssue(path, f"value '{value}' does not match pattern {pattern_text}"))
+
+        checks.append(_check_pattern)
+
+    if "minimum" in schema:
+        minimum = schema["minimum"]
+
+        def _check_minimum(value: Any, path: PathChain, issues: Issues) -> None:
+            if type(value) in _NUMBER_TYPES and value < minimum:
+                if issues is None:
+                    raise _Invalid
+                issues.append(ValidationIssue(path, f"value {value} below minimum {minimum}"))
 
-    if "enum" in schema and value not in schema["enum"]:
-        issues.append(ValidationIssue(path, f"expected one of {schema['enum']}, received {value!r}"))
+        checks.append(_check_minimum)
 
-    if "pattern" in schema and isinstance(value, str):
-        if not re.search(schema["pattern"], value):
-            issues.append(ValidationIssue(path, f"value '{value}' does not match pattern {schema['pattern']}"))
+    if "exclusiveMinimum" in schema:
+        floor = schema["exclusiveMinimum"]
 
-    if "minimum" in schema and isinstance(value, (int, float)) and not isinstance(value, bool):
-        if value < schema["minimum"]:
-            issues.append(ValidationIssue(path, f"value {value} below minimum {schema['minimum']}"))
+        def _check_exclusive_minimum(value: Any, path: PathChain, issues: Issues) -> None:
+            if type(value) in _NUMBER_TYPES and value <= floor:
+                if issues is None:
+                    raise _Invalid
+                issues.append(ValidationIssue(path, f"value {value} must be greater than {floor}"))
 
-    if "exclusiveMinimum" in schema and isinstance(value, (int, float)) and not isinstance(value, bool):
-        if value <= schema["exclusiveMinimum"]:
-            issues.append(ValidationIssue(path, f"value {value} must be greater than {schema['exclusiveMinimum']}"))
+        checks.append(_check_exclusive_minimum)
 
-    schema_type = type_decl
-    if schema_type == "object" or (not schema_type and isinstance(value, dict)):
+    if type_decl == "object" or not type_decl:
+        guard_dict = not type_decl
         required = schema.get("required", [])
-        for key in required:
-            if key not in value:
-                issues.append(ValidationIssue(f"{path}.{key}", "missing required property"))
+        required_keys = frozenset(required)
         props = schema.get("properties", {})
+        children = []
         for key, subschema in props.items():
-            if key in value:
-                issues.extend(validate_schema(value[key], subschema, f"{path}.{key}"))
-        if schema.get("additionalProperties") is False:
-            allowed = set(props.keys())
-            for key in value.keys():
-                if key not in allowed:
-                    issues.append(ValidationIssue(f"{path}.{key}", "additional properties are not allowed"))
-
-    if schema_type == "array" or (not schema_type and isinstance(value, list)):
+            leaf = _leaf_types(subschema)
+            if leaf is None:
+                children.append((key, compile_schema(subschema), frozenset(), []))
+            else:
+                children.append((key, None, *leaf))
+        allowed_keys = frozenset(props) if schema.get("additionalProperties") is False else None
+
+        def _check_object(value: Any, path: PathChain, issues: Issues) -> None:
+            if guard_dict and type(value) is not dict:
+                return
+            missing = required_keys - value.keys()
+            if missing:
+                if issues is None:
+                    raise _Invalid
+                for key in required:
+                    if key in missing:
+                        issues.append(ValidationIssue((path, key), "missing required property"))
+            for key, child, leaf_types, leaf_expected in children:
+                if key in value:
+                    if child is not None:
+                        child(value[key], (path, key), issues)
+                        continue
+                    item = value[key]
+                    if type(item) not in leaf_types:
+                        if issues is None:
+                            raise _Invalid
+                        issues.append(_type_issue((path, key), leaf_expected, item))
+            if allowed_keys is not None:
+                extra = value.keys() - allowed_keys
+                if extra:
+                    if issues is None:
+                        raise _Invalid
+                    for key in value:
+                        if key in extra:
+                            issues.append(ValidationIssue((path, key), "additional properties are not allowed"))
+
+        checks.append(_check_object)
+
+    if type_decl == "array" or not type_decl:
+        guard_list = not type_decl
         min_items = schema.get("minItems")
-        if min_items is not None and len(value) < min_items:
-            issues.append(ValidationIssue(path, f"expected at least {min_items} items"))
         item_schema = schema.get("items")
+        item_check = None
+        item_leaf = None
         if isinstance(item_schema, dict):
-            for index, item in enumerate(value):
-                issues.extend(validate_schema(item, item_schema, f"{path}[{index}]"))
+            item_leaf = _leaf_types(item_schema)
+            if item_leaf is None:
+                item_check = compile_schema(item_schema)
+
+        def _check_array(value: Any, path: PathChain, issues: Issues) -> None:
+            if guard_list and type(value) is not list:
+                return
+            if min_items is not None and len(value) < min_items:
+                if issues is None:
+                    raise _Invalid
+                issues.append(ValidationIssue(path, f"expected at least {min_items} items"))
+            if item_check is not None:
+                for index, item in enumerate(value):
+                    item_check(item, (path, index), issues)
+            elif item_leaf is not None:
+                item_types, item_expected = item_leaf
+                # map() keeps the all-valid scan in C; only report per item on failure
+                if all(map(item_types.__contains__, map(type, value))):
+                    return
+                if issues is None:
+                    raise _Invalid
+                for index, item in enumerate(value):
+                    if type(item) not in item_types:
+                        issues.append(_type_issue((path, index), item_expected, item))
+
+        checks.append(_check_array)
+
+    checks.extend(extra_checks)
+
+    def validate(value: Any, path: PathChain, issues: Issues) -> None:
+        if expected and type(value) not in types:
+            if issues is None:
+                raise _Invalid
+            issues.append(_type_issue(path, expected, value))
+            return
+        for check in checks:
+            check(value, path, issues)
+
+    return validate
+
+
+def validate_schema(value: Any, schema: Dict[str, Any], path: PathChain = "$") -> List[ValidationIssue]:
+    issues: List[ValidationIssue] = []
+    compile_schema(schema)(value, path, issues)
     return issues
 
 
-def validate_node(node: Dict[str, Any], schema: Dict[str, Any], index: int) -> List[ValidationIssue]:
-    issues = validate_schema(node, schema, f"node[{index}]")
-    safety = node.get("safety", {})
-    if safety.get("motionOptIn"):
+def _check_safety(node: Dict[str, Any], path: PathChain, issues: Issues) -> None:
+    safety = node.get("safety")
+    if type(safety) is dict and safety.get("motionOptIn"):
         sweep = safety.get("minSweepSec")
-        if sweep is None or sweep < 14:
-            issues.append(ValidationIssue(f"node[{index}].safety.minSweepSec", "must be >= 14 seconds when motionOptIn is true"))
+        if type(sweep) not in _NUMBER_TYPES or sweep < 14:
+            if issues is None:
+                raise _Invalid
+            issues.append(ValidationIssue(((path, "safety"), "minSweepSec"), "must be >= 14 seconds when motionOptIn is true"))
+
+
+def compile_node_validator(schema: Dict[str, Any]) -> Validator:
+    """Compile the node schema with the ND-safe timing rule folded in as its last check."""
+    return compile_schema(schema, (_check_safety,))
+
+
+def validate_node(node: Dict[str, Any], validate: Validator, index: int) -> List[ValidationIssue]:
+    """Collect every issue for one node; validate comes from compile_node_validator."""
+    issues: List[ValidationIssue] = []
+    validate(node, ("node", index), issues)
+    return issues
+
+
+def node_is_valid(node: Dict[str, Any], validate: Validator) -> bool:
+    """Pass/fail check that stops at the first problem without building a report."""
+    try:
+        validate(node, "", None)
+    except _Invalid:
+        return False
+    return True
+
+
+def _stream_nodes(handle: IO[bytes]) -> Optional[Iterator[Any]]:
+    """Return an iterator over the top-level "nodes" array, or None if it is not an array."""
+    events = ijson.parse(handle, use_float=True)
+    for prefix, event, _ in events:
+        if prefix == "nodes":
+            return ijson.items(events, "nodes.item") if event == "start_array" else None
+    return None
+
+
+@contextmanager
+def open_nodes(data_path: Path) -> Iterator[Optional[Iterable[Any]]]:
+    """Yield the bundle's nodes (streamed for large files), or None when missing."""
+    if ijson is not None and data_path.stat().st_size >= STREAM_THRESHOLD_BYTES:
+        with data_path.open("rb") as handle:
+            yield _stream_nodes(handle)
+        return
+    payload = load_json(data_path)
+    nodes = payload.get("nodes") if isinstance(payload, dict) else None
+    yield nodes if isinstance(nodes, list) else None
+
+
+def _validate_nodes(nodes: Iterable[Any], validate: Validator, issues: List[ValidationIssue], start: int = 0) -> int:
+    """Validate nodes numbered from start, appending to issues; returns the node count."""
+    count = 0
+    for index, node in enumerate(nodes, start):
+        count += 1
+        if not isinstance(node, dict):
+            issues.append(ValidationIssue(("node", index), "expected object"))
+            continue
+        if not node_is_valid(node, validate):
+            issues.extend(validate_node(node, validate, index))
+    return count
+
+
+def _chunks(nodes: Iterable[Any], size: int) -> Iterator[Tuple[int, List[Any]]]:
+    batch: List[Any] = []
+    start = 0
+    for node in nodes:
+        batch.append(node)
+        if len(batch) == size:
+            yield start, batch
+            start += size
+            batch = []
+    if batch:
+        yield start, batch
+
+
+_worker_validate: Optional[Validator] = None
+
+
+def _init_worker(schema_path: Path) -> None:
+    """Compile the schema once per worker process rather than once per task."""
+    global _worker_validate
+    _worker_validate = compile_node_validator(load_json(schema_path))
+
+
+def _validate_chunk(chunk: Tuple[int, List[Any]]) -> List[ValidationIssue]:
+    start, nodes = chunk
+    issues: List[ValidationIssue] = []
+    _validate_nodes(nodes, _worker_validate, issues, start)
     return issues
 
 
-def run_validation(data_path: Path, schema_path: Path) -> int:
+def _validate_parallel(nodes: Iterable[Any], schema_path: Path, jobs: int, issues: List[ValidationIssue]) -> int:
+    """Shard nodes across worker processes, keeping results in node order.
+
+    At most two chunks per worker are in flight so a streamed bundle is never
+    pulled into memory all at once.
+    """
+    count = 0
+    pending: deque = deque()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(schema_path,)) as pool:
+        for chunk in _chunks(nodes, CHUNK_SIZE):
+            count += len(chunk[1])
+            pending.append(pool.submit(_validate_chunk, chunk))
+            if len(pending) >= jobs * 2:
+                issues.extend(pending.popleft().result())
+        while pending:
+            issues.extend(pending.popleft().result())
+    return count
+
+
+def run_validation(data_path: Path, schema_path: Path, jobs: int = 1) -> int:
     if not data_path.exists():
         print(f"[ERROR] Missing data bundle: {data_path}")
         return 2
@@ -120,40 +416,50 @@ def run_validation(data_path: Path, schema_path: Path) -> int:
         print(f"[ERROR] Missing schema file: {schema_path}")
         return 2
 
-    payload = load_json(data_path)
-    schema = load_json(schema_path)
-
-    nodes = payload.get("nodes")
-    if not isinstance(nodes, list):
-        print("[ERROR] Payload missing 'nodes' array")
-        return 1
-
     issues: List[ValidationIssue] = []
-    for index, node in enumerate(nodes):
-        if not isinstance(node, dict):
-            issues.append(ValidationIssue(f"node[{index}]", "expected object"))
-            continue
-        issues.extend(validate_node(node, schema, index))
+    with open_nodes(data_path) as nodes:
+        if nodes is None:
+            print("[ERROR] Payload missing 'nodes' array")
+            return 1
+        if jobs > 1:
+            # each worker compiles its own validator from schema_path
+            count = _validate_parallel(nodes, schema_path, jobs, issues)
+        else:
+            count = _validate_nodes(nodes, compile_node_validator(load_json(schema_path)), issues)
 
     if issues:
         for issue in issues:
             print(f"[FAIL] {issue.path}: {issue.message}")
-        print(f"[ERROR] Validation failed for {len(issues)} issues across {len(nodes)} nodes.")
+        print(f"[ERROR] Validation failed for {len(issues)} issues across {count} nodes.")
         return 1
 
-    print(f"[OK] {len(nodes)} nodes validated against schema and safety rules.")
+    print(f"[OK] {count} nodes validated against schema and safety rules.")
     return 0
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    argv = list(argv or sys.argv[1:])
-    if len(argv) > 2:
-        print("Usage: python scripts/validate_codex.py [data_path] [schema_path]")
+    args = iter(sys.argv[1:] if argv is None else argv)
+    positional: List[str] = []
+    jobs = 1
+    for arg in args:
+        if arg == "--jobs" or arg.startswith("--jobs="):
+            value = arg.partition("=")[2] if "=" in arg else next(args, "")
+            try:
+                jobs = int(value)
+            except ValueError:  # e.g. "two", or "²" which str.isdigit() would accept
+                jobs = 0
+            if jobs < 1:
+                print(USAGE)
+                return 2
+        else:
+            positional.append(arg)
+    if len(positional) > 2:
+        print(USAGE)
         return 2
 
-    data_path = Path(argv[0]) if argv else DEFAULT_DATA_PATH
-    schema_path = Path(argv[1]) if len(argv) == 2 else DEFAULT_SCHEMA_PATH
-    return run_validation(data_path, schema_path)
+    data_path = Path(positional[0]) if positional else DEFAULT_DATA_PATH
+    schema_path = Path(positional[1]) if len(positional) == 2 else DEFAULT_SCHEMA_PATH
+    return run_validation(data_path, schema_path, jobs)
 
 
 if __name__ == "__main__":
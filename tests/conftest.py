@@ -0,0 +1,95 @@
+"""Session fixtures that read each renderer artifact once per test run."""
+
+import json
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+try:
+    import orjson
+except ImportError:  # the fixture parses to the same objects either way
+    orjson = None
+
+ROOT = Path(__file__).resolve().parents[1]
+INDEX = ROOT / "index.html"
+README = ROOT / "README_RENDERER.md"
+MODULE_PATH = ROOT / "js" / "helix-renderer.mjs"
+PALETTE_PATH = ROOT / "data" / "palette.json"
+
+_RE_SECTION = re.compile(r"(?ms)^##\s+(.+?)\s*\n(.*?)(?=^##\s+|\Z)")
+# tests that request any of these only read repo files and can run on any xdist worker
+_FS_READ_FIXTURES = frozenset({"index_html", "readme_text", "readme_sections", "dir_entries", "renderer_mjs", "palette_json"})
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "fs_read: test only reads renderer artifacts from the repo")
+
+
+def pytest_collection_modifyitems(items):
+    for item in items:
+        if not _FS_READ_FIXTURES.isdisjoint(item.fixturenames):
+            item.add_marker(pytest.mark.fs_read)
+
+
+def _read(path: Path, missing: str) -> str:
+    # a single open instead of exists() then read_text()
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        pytest.fail(missing)
+
+
+@pytest.fixture(scope="session")
+def index_html() -> str:
+    text = _read(INDEX, "index.html must exist at repo root")
+    assert text.strip(), "index.html is empty"
+    return text
+
+
+@pytest.fixture(scope="session")
+def readme_text() -> str:
+    text = _read(README, "README_RENDERER.md must exist")
+    assert text.strip(), "README_RENDERER.md is empty"
+    return text
+
+
+@pytest.fixture(scope="session")
+def readme_sections(readme_text) -> dict:
+    """Map each `## ` header to its body in one pass; the first repeat wins."""
+    sections = {}
+    for header, body in _RE_SECTION.findall(readme_text):
+        sections.setdefault(header, body)
+    return sections
+
+
+@pytest.fixture(scope="session")
+def dir_entries():
+    """Return entry names for a directory under ROOT, scanning each directory once."""
+    cache = {}
+
+    def names(relative: str = "") -> frozenset:
+        if relative not in cache:
+            try:
+                with os.scandir(ROOT / relative) as it:
+                    cache[relative] = frozenset(entry.name for entry in it)
+            except FileNotFoundError:
+                cache[relative] = frozenset()
+        return cache[relative]
+
+    return names
+
+
+@pytest.fixture(scope="session")
+def renderer_mjs() -> str:
+    text = MODULE_PATH.read_text(encoding="utf-8")
+    assert text.strip(), "helix-renderer.mjs should not be empty"
+    return text
+
+
+@pytest.fixture(scope="session")
+def palette_json():
+    if orjson is not None:
+        return orjson.loads(PALETTE_PATH.read_bytes())
+    return json.loads(PALETTE_PATH.read_text(encoding="utf-8"))
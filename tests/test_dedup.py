@@ -17,3 +17,80 @@ def test_dedup_file(tmp_path):
     dups = dedup_file(p, fix=True)
     assert dups == [(2, 'a'), (4, 'b')]
     assert p.read_text(encoding='utf-8') == 'a\nb\n'
+
+
+def test_iter_text_files_skips_excluded_dirs(tmp_path):
+    load()
+    from dedup import iter_text_files
+    (tmp_path / 'node_modules').mkdir()
+    (tmp_path / 'node_modules' / 'pkg.js').write_text('x\n', encoding='utf-8')
+    (tmp_path / 'docs').mkdir()
+    (tmp_path / 'docs' / 'notes.md').write_text('x\n', encoding='utf-8')
+    (tmp_path / 'image.png').write_bytes(b'\x89PNG')
+    names = sorted(entry.name for entry in iter_text_files(tmp_path))
+    assert names == ['notes.md']
+
+
+def test_iter_text_files_skips_unreadable_dirs(tmp_path, monkeypatch):
+    load()
+    import dedup
+    (tmp_path / 'locked').mkdir()
+    (tmp_path / 'locked' / 'hidden.md').write_text('x\n', encoding='utf-8')
+    (tmp_path / 'open').mkdir()
+    (tmp_path / 'open' / 'notes.md').write_text('x\n', encoding='utf-8')
+    (tmp_path / 'top.txt').write_text('x\n', encoding='utf-8')
+    real_scandir = dedup.os.scandir
+
+    def scandir(path):
+        if Path(path).name == 'locked':
+            raise PermissionError(13, 'Permission denied', str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(dedup.os, 'scandir', scandir)
+    names = sorted(entry.name for entry in dedup.iter_text_files(tmp_path))
+    assert names == ['notes.md', 'top.txt']
+
+
+def test_dedup_file_reports_without_fix(tmp_path):
+    dedup_file = load()
+    p = tmp_path / 'sample.md'
+    original = b'x\n\n\ny\ny\n'
+    p.write_bytes(original)
+    assert dedup_file(str(p)) == [(5, 'y')]
+    assert p.read_bytes() == original
+
+
+def test_dedup_fix_without_trailing_newline(tmp_path):
+    dedup_file = load()
+    p = tmp_path / 'tail.txt'
+    p.write_bytes(b'x\ny\ny\nz\nz')
+    assert dedup_file(p, fix=True) == [(3, 'y'), (5, 'z')]
+    assert p.read_bytes() == b'x\ny\nz\n'
+
+
+def test_dedup_only_splits_on_newlines(tmp_path):
+    dedup_file = load()
+    p = tmp_path / 'data.json'
+    original = 'a\u2028a\nb\x0cb\nc\nc\n'.encode('utf-8')
+    p.write_bytes(original)
+    assert dedup_file(p) == [(4, 'c')]
+    dedup_file(p, fix=True)
+    assert p.read_bytes() == 'a\u2028a\nb\x0cb\nc\n'.encode('utf-8')
+
+
+def test_dedup_fix_normalises_crlf(tmp_path):
+    dedup_file = load()
+    p = tmp_path / 'crlf.txt'
+    p.write_bytes(b'a\r\na\r\nb\r\n')
+    assert dedup_file(p, fix=True) == [(2, 'a')]
+    assert p.read_bytes() == b'a\nb\n'
+
+
+def test_dedup_fix_keeps_file_mode(tmp_path):
+    dedup_file = load()
+    p = tmp_path / 'script.py'
+    p.write_bytes(b'x\nx\n')
+    p.chmod(0o754)
+    dedup_file(p, fix=True)
+    assert p.read_bytes() == b'x\n'
+    assert p.stat().st_mode & 0o777 == 0o754
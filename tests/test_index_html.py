@@ -1,77 +1,135 @@
 import re
-from pathlib import Path
-
-ROOT = Path(__file__).resolve().parents[1]
-INDEX = ROOT / "index.html"
-
-
-def load_html() -> str:
-    assert INDEX.exists(), "index.html must exist at repo root"
-    text = INDEX.read_text(encoding="utf-8")
-    assert text.strip(), "index.html is empty"
-    return text
-
-
-def test_head_and_canvas_structure():
-    html = load_html()
-    assert html.lstrip().lower().startswith("<!doctype html>"), "doctype must be html"
-    assert re.search(r"<html[^>]*\blang=['\"]en['\"]", html, re.I)
-    assert re.search(r"<meta charset=", html)
-    assert re.search(r"Cosmic Helix Renderer \(ND-safe, Offline\)", html)
-    assert "width=\"1440\"" in html and "height=\"900\"" in html
-    assert "aria-label=\"Layered sacred geometry canvas\"" in html
-
-
-def test_css_variables_and_status():
-    html = load_html()
-    assert "--bg: #0b0b12" in html
-    assert "--ink: #e8e8f0" in html
-    assert "--muted: #a6a6c1" in html
-    assert "Loading palette" in html
-    assert "ND-safe styling" in html
-
-
-def test_module_script_and_helpers():
-    html = load_html()
-    assert re.search(r"<script[^>]+type=\"module\"", html)
-    assert "import { renderHelix } from \"./js/helix-renderer.mjs\"" in html
-    assert re.search(r"function\s+setStatus\s*\(", html)
-    assert re.search(r"async\s+function\s+loadJSON\s*\(", html)
-    assert "fetch(path, { cache: \"no-store\" })" in html
-    assert "Offline-first ND safety" in html
-
-
-def test_fallback_palette_definition():
-    html = load_html()
-    assert "const FALLBACK" in html
-    for color in ["#b1c7ff", "#89f7fe", "#a0ffa1", "#ffd27f", "#f5a3ff", "#d0d0e6"]:
-        assert color in html
-
-
-def test_numerology_constants_and_render_call():
-    html = load_html()
-    for constant, value in [
-        ("THREE", 3),
-        ("SEVEN", 7),
-        ("NINE", 9),
-        ("ELEVEN", 11),
-        ("TWENTYTWO", 22),
-        ("THIRTYTHREE", 33),
-        ("NINETYNINE", 99),
-        ("ONEFORTYFOUR", 144),
-    ]:
-        assert re.search(rf"{constant}\s*:\s*{value}", html)
-    assert re.search(r"renderHelix\(\s*ctx\s*,\s*\{[^}]*palette: activePalette[^}]*NUM[^}]*\}\s*\)", html)
-
-
-def test_note_mentions_all_layers():
-    html = load_html()
-    assert "Vesica" in html
-    assert "Tree-of-Life" in html
-    assert "Fibonacci" in html
-    assert "double-helix" in html
-
-
-def test_offline_shell_has_no_http_links():
-    html = load_html()
-    assert "http://" not in html and "https://" not in html
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Tuple
+
+import pytest
+
+NUMEROLOGY = {
+    "THREE": "3",
+    "SEVEN": "7",
+    "NINE": "9",
+    "ELEVEN": "11",
+    "TWENTYTWO": "22",
+    "THIRTYTHREE": "33",
+    "NINETYNINE": "99",
+    "ONEFORTYFOUR": "144",
+}
+FALLBACK_COLORS = {"#b1c7ff", "#89f7fe", "#a0ffa1", "#ffd27f", "#f5a3ff", "#d0d0e6"}
+# one alternation covers every structural token, so the page is scanned once
+_RE_STRUCTURE = re.compile(
+    r"(?P<html><html\b[^>]*>)"
+    r"|(?P<canvas><canvas\b[^>]*>)"
+    r"|(?P<module><script[^>]+type=\"module\")"
+    r"|(?P<function>(?P<async>async\s+)?function\s+(?P<name>\w+)\s*\()"
+    r"|(?P<render>renderHelix\(\s*ctx\s*,\s*\{[^}]*palette: activePalette[^}]*NUM[^}]*\}\s*\))"
+    r"|(?P<constant>\b(?P<const_name>[A-Z][A-Z0-9_]*)\s*:\s*(?P<const_value>\d+))"
+    r"|(?P<color>#[0-9A-Fa-f]{6}\b)"
+)
+_RE_ATTR = re.compile(r'([\w-]+)="([^"]*)"')
+
+
+@dataclass(frozen=True)
+class HtmlSummary:
+    doctype_ok: bool
+    lang_en: bool
+    charset: bool
+    canvas: Dict[str, str]
+    module_script: bool
+    functions: FrozenSet[str]
+    async_functions: FrozenSet[str]
+    render_call: bool
+    constants: FrozenSet[Tuple[str, str]]
+    colors: FrozenSet[str]
+    has_http: bool
+
+
+def summarize_html(html: str) -> HtmlSummary:
+    lang_en = module_script = render_call = False
+    canvas: Dict[str, str] = {}
+    functions, async_functions, constants, colors = set(), set(), set(), set()
+    for match in _RE_STRUCTURE.finditer(html):
+        kind = match.lastgroup
+        if kind == "color":
+            colors.add(match.group(kind))
+        elif kind == "constant":
+            constants.add((match.group("const_name"), match.group("const_value")))
+        elif kind == "function":
+            name = match.group("name")
+            functions.add(name)
+            if match.group("async"):
+                async_functions.add(name)
+        elif kind == "html":
+            tag = match.group(kind)
+            lang_en = lang_en or 'lang="en"' in tag or "lang='en'" in tag
+        elif kind == "canvas":
+            canvas = canvas or dict(_RE_ATTR.findall(match.group(kind)))
+        elif kind == "module":
+            module_script = True
+        elif kind == "render":
+            render_call = True
+    return HtmlSummary(
+        doctype_ok=html.lstrip().lower().startswith("<!doctype html>"),
+        lang_en=lang_en,
+        charset="<meta charset=" in html,
+        canvas=canvas,
+        module_script=module_script,
+        functions=frozenset(functions),
+        async_functions=frozenset(async_functions),
+        render_call=render_call,
+        constants=frozenset(constants),
+        colors=frozenset(colors),
+        has_http="http://" in html or "https://" in html,
+    )
+
+
+@pytest.fixture(scope="session")
+def html_summary(index_html) -> HtmlSummary:
+    return summarize_html(index_html)
+
+
+def test_head_and_canvas_structure(index_html, html_summary):
+    assert html_summary.doctype_ok, "doctype must be html"
+    assert html_summary.lang_en
+    assert html_summary.charset
+    assert "Cosmic Helix Renderer (ND-safe, Offline)" in index_html
+    canvas = html_summary.canvas
+    assert canvas.get("width") == "1440" and canvas.get("height") == "900"
+    assert canvas.get("aria-label") == "Layered sacred geometry canvas"
+
+
+def test_css_variables_and_status(index_html):
+    assert "--bg: #0b0b12" in index_html
+    assert "--ink: #e8e8f0" in index_html
+    assert "--muted: #a6a6c1" in index_html
+    assert "Loading palette" in index_html
+    assert "ND-safe styling" in index_html
+
+
+def test_module_script_and_helpers(index_html, html_summary):
+    assert html_summary.module_script
+    assert "import { renderHelix } from \"./js/helix-renderer.mjs\"" in index_html
+    assert "setStatus" in html_summary.functions
+    assert "loadJSON" in html_summary.async_functions
+    assert "fetch(path, { cache: \"no-store\" })" in index_html
+    assert "Offline-first ND safety" in index_html
+
+
+def test_fallback_palette_definition(index_html, html_summary):
+    assert "const FALLBACK" in index_html
+    assert FALLBACK_COLORS <= html_summary.colors
+
+
+def test_numerology_constants_and_render_call(html_summary):
+    assert set(NUMEROLOGY.items()) <= html_summary.constants
+    assert html_summary.render_call
+
+
+def test_note_mentions_all_layers(index_html):
+    assert "Vesica" in index_html
+    assert "Tree-of-Life" in index_html
+    assert "Fibonacci" in index_html
+    assert "double-helix" in index_html
+
+
+def test_offline_shell_has_no_http_links(html_summary):
+    assert not html_summary.has_http
@@ -1,58 +1,54 @@
-import json
 import re
-from pathlib import Path
-
-ROOT = Path(__file__).resolve().parents[1]
-PALETTE_PATH = ROOT / "data" / "palette.json"
-MODULE_PATH = ROOT / "js" / "helix-renderer.mjs"
-
-
-def read_module_text() -> str:
-    text = MODULE_PATH.read_text(encoding="utf-8")
-    assert text.strip(), "helix-renderer.mjs should not be empty"
-    return text
-
-
-def test_palette_structure():
-    data = json.loads(PALETTE_PATH.read_text(encoding="utf-8"))
-    assert set(data.keys()) == {"bg", "ink", "layers"}
-    assert len(data["layers"]) == 6
-    for value in [data["bg"], data["ink"], *data["layers"]]:
-        assert isinstance(value, str) and value.startswith("#") and len(value) == 7
-
-
-def test_module_exports_present():
-    txt = read_module_text()
-    for name in [
-        "function drawVesica",
-        "function drawTree",
-        "function drawFibonacci",
-        "function drawHelix",
-        "function renderHelix",
-    ]:
-        assert name in txt
-    assert "export {" in txt and "renderHelix" in txt
-
-
-def test_helpers_documented():
-    txt = read_module_text()
-    assert "GOLDEN_RATIO" in txt
-    assert "DEFAULT_NUM" in txt and "DEFAULT_PALETTE" in txt
-    assert "function ensurePalette" in txt
-    assert "function ensureNumerology" in txt
-    assert "function normalizeOptions" in txt
-
-
-def test_helix_point_formula_comment():
-    txt = read_module_text()
-    assert "helixPoint" in txt
-    assert "Crossbars tie the two strands" in txt
-
-
-def test_render_invocation_notes():
-    txt = read_module_text()
-    assert "prepareContext" in txt
-    assert re.search(r"drawVesica\(ctx,", txt)
-    assert re.search(r"drawTree\(ctx,", txt)
-    assert re.search(r"drawFibonacci\(ctx,", txt)
-    assert re.search(r"drawHelix\(ctx,", txt)
+
+import pytest
+
+_HEX6 = re.compile(r"#[0-9A-Fa-f]{6}")
+
+
+def test_palette_structure(palette_json):
+    assert set(palette_json.keys()) == {"bg", "ink", "layers"}
+    assert len(palette_json["layers"]) == 6
+    for value in [palette_json["bg"], palette_json["ink"], *palette_json["layers"]]:
+        assert isinstance(value, str) and _HEX6.fullmatch(value), value
+
+
+def test_palette_contrast(palette_json):
+    """Every ink/layer hue meets WCAG AA (4.5:1) against bg, per the README's palette guidance."""
+    np = pytest.importorskip("numpy")
+    colors = [palette_json["bg"], palette_json["ink"], *palette_json["layers"]]
+    rgb = np.array([[int(h[i:i + 2], 16) for i in (1, 3, 5)] for h in colors], dtype=np.float64) / 255.0
+    linear = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    lum = linear @ np.array([0.2126, 0.7152, 0.0722])
+    bg, fg = lum[0], lum[1:]
+    ratios = (np.maximum(bg, fg) + 0.05) / (np.minimum(bg, fg) + 0.05)
+    assert (ratios >= 4.5).all(), dict(zip(colors[1:], ratios.round(2)))
+
+
+@pytest.mark.parametrize("name", ["drawVesica", "drawTree", "drawFibonacci", "drawHelix", "renderHelix"])
+def test_layer_function_defined(renderer_mjs, name):
+    assert f"function {name}" in renderer_mjs
+
+
+def test_module_exports_present(renderer_mjs):
+    assert "export {" in renderer_mjs and "renderHelix" in renderer_mjs
+
+
+def test_helpers_documented(renderer_mjs):
+    assert "GOLDEN_RATIO" in renderer_mjs
+    assert "DEFAULT_NUM" in renderer_mjs and "DEFAULT_PALETTE" in renderer_mjs
+    assert "function ensurePalette" in renderer_mjs
+    assert "function ensureNumerology" in renderer_mjs
+    assert "function normalizeOptions" in renderer_mjs
+
+
+def test_helix_point_formula_comment(renderer_mjs):
+    assert "helixPoint" in renderer_mjs
+    assert "Crossbars tie the two strands" in renderer_mjs
+
+
+def test_render_invocation_notes(renderer_mjs):
+    assert "prepareContext" in renderer_mjs
+    assert "drawVesica(ctx," in renderer_mjs
+    assert "drawTree(ctx," in renderer_mjs
+    assert "drawFibonacci(ctx," in renderer_mjs
+    assert "drawHelix(ctx," in renderer_mjs
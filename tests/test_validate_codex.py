@@ -1,13 +1,27 @@
+import importlib.util
 import json
 import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SCRIPT = ROOT / "scripts" / "validate_codex.py"
 SCHEMA = ROOT / "schema" / "codex-node.schema.json"
 
 
+def load_validator_module():
+    spec = importlib.util.spec_from_file_location("validate_codex", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+validator = load_validator_module()
+
+
 def copy_validator(temp_root: Path) -> Path:
     scripts_dir = temp_root / "scripts"
     schema_dir = temp_root / "schema"
@@ -20,6 +34,14 @@ def copy_validator(temp_root: Path) -> Path:
     return script_path
 
 
+@pytest.fixture(scope="session")
+def validator_scaffold(tmp_path_factory) -> Path:
+    """Repo-shaped copy of the validator and schema, written once and never modified."""
+    root = tmp_path_factory.mktemp("validator")
+    copy_validator(root)
+    return root
+
+
 def write_bundle(tmp_path: Path, nodes):
     dist_dir = tmp_path / "dist"
     dist_dir.mkdir(parents=True, exist_ok=True)
@@ -35,56 +57,131 @@ def write_bundle(tmp_path: Path, nodes):
     (dist_dir / "codex.min.json").write_text(json.dumps(payload), encoding="utf-8")
 
 
-def run_validator(tmp_path: Path, script_path: Path):
+def run_validator(tmp_path: Path, script_path: Path, *args: str):
     return subprocess.run(
-        [sys.executable, str(script_path)],
+        [sys.executable, str(script_path), *args],
         cwd=str(tmp_path),
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
+        capture_output=True,
     )
 
 
+_BASE_NODE = {
+    "id": 0,
+    "slug": "vesica-seed",
+    "title": "Test",
+    "layer": "vesica",
+    "summary": "placeholder",
+    "keywords": ("vesica",),
+    "geometry": {"grid": {"columns": 3, "rows": 3, "radius": 22}},
+    "numerology": {"triad": 3, "heptad": 7, "ennead": 9, "paths": 22, "lattice": 33},
+    "safety": {"ndSafe": True, "motionOptIn": False, "minSweepSec": None, "notes": "static"},
+    "provenance": {"sources": ("notes",), "reviewed": "2024-05-01", "confidence": "stable"},
+    "notes": "ok"
+}
+
+
 def base_node():
-    return {
-        "id": 0,
-        "slug": "vesica-seed",
-        "title": "Test",
-        "layer": "vesica",
-        "summary": "placeholder",
-        "keywords": ["vesica"],
-        "geometry": {"grid": {"columns": 3, "rows": 3, "radius": 22}},
-        "numerology": {"triad": 3, "heptad": 7, "ennead": 9, "paths": 22, "lattice": 33},
-        "safety": {"ndSafe": True, "motionOptIn": False, "minSweepSec": None, "notes": "static"},
-        "provenance": {"sources": ["notes"], "reviewed": "2024-05-01", "confidence": "stable"},
-        "notes": "ok"
-    }
+    # tests replace top-level keys; only the sub-dicts they might edit in place are copied
+    node = _BASE_NODE.copy()
+    node["geometry"] = {"grid": _BASE_NODE["geometry"]["grid"].copy()}
+    node["safety"] = _BASE_NODE["safety"].copy()
+    return node
 
 
-def test_validator_passes_on_valid_payload(tmp_path: Path):
-    script = copy_validator(tmp_path)
+def run_main(tmp_path: Path, capsys, *args: str):
+    bundle = tmp_path / "dist" / "codex.min.json"
+    code = validator.main([*args, str(bundle), str(SCHEMA)])
+    return code, capsys.readouterr().out
+
+
+def test_validator_passes_on_valid_payload(tmp_path: Path, capsys):
     nodes = [base_node(), {**base_node(), "id": 1, "slug": "helix", "layer": "helix", "safety": {"ndSafe": True, "motionOptIn": True, "minSweepSec": 18, "notes": "consent"}}]
     write_bundle(tmp_path, nodes)
-    result = run_validator(tmp_path, script)
-    assert result.returncode == 0
-    assert "[OK]" in result.stdout
+    code, out = run_main(tmp_path, capsys)
+    assert code == 0
+    assert "[OK]" in out
 
 
-def test_validator_catches_fast_motion(tmp_path: Path):
-    script = copy_validator(tmp_path)
+def test_validator_catches_fast_motion(tmp_path: Path, capsys):
     bad_node = base_node()
     bad_node["safety"] = {"ndSafe": True, "motionOptIn": True, "minSweepSec": 5, "notes": "too fast"}
     write_bundle(tmp_path, [bad_node])
-    result = run_validator(tmp_path, script)
-    assert result.returncode == 1
-    assert "minSweepSec" in result.stdout
+    code, out = run_main(tmp_path, capsys)
+    assert code == 1
+    assert "minSweepSec" in out
 
 
-def test_validator_detects_schema_issue(tmp_path: Path):
-    script = copy_validator(tmp_path)
+def test_validator_detects_schema_issue(tmp_path: Path, capsys):
     broken = base_node()
     broken.pop("provenance")
     write_bundle(tmp_path, [broken])
-    result = run_validator(tmp_path, script)
-    assert result.returncode == 1
-    assert "provenance" in result.stdout
+    code, out = run_main(tmp_path, capsys)
+    assert code == 1
+    assert "provenance" in out
+
+
+def test_validator_reports_pattern_mismatch(tmp_path: Path, capsys):
+    bad_slug = base_node()
+    bad_slug["slug"] = "Not A Slug"
+    write_bundle(tmp_path, [bad_slug])
+    code, out = run_main(tmp_path, capsys)
+    assert code == 1
+    assert "node[0].slug" in out
+
+
+def test_validator_parallel_jobs_report_in_node_order(validator_scaffold: Path, tmp_path: Path):
+    # the one subprocess run: covers the __main__ path and the worker pool;
+    # the shared scaffold is only read, the bundle lives in this test's tmp_path
+    script = validator_scaffold / "scripts" / SCRIPT.name
+    nodes = [base_node() for _ in range(5)]
+    nodes[1]["slug"] = "Bad Slug"
+    nodes[4]["safety"] = {"ndSafe": True, "motionOptIn": True, "minSweepSec": 5, "notes": "too fast"}
+    write_bundle(tmp_path, nodes)
+    paths = (str(tmp_path / "dist" / "codex.min.json"), str(validator_scaffold / "schema" / SCHEMA.name))
+    serial = run_validator(tmp_path, script, *paths)
+    parallel = run_validator(tmp_path, script, "--jobs", "2", *paths)
+    # output stays bytes; it is only decoded to explain a failure
+    assert parallel.returncode == serial.returncode == 1, parallel.stderr.decode("utf-8", "replace")
+    assert parallel.stdout == serial.stdout
+    assert parallel.stdout.index(b"node[1].slug") < parallel.stdout.index(b"node[4].safety")
+
+
+@pytest.mark.parametrize("jobs", ["0", "-2", "two", "²", ""])
+def test_validator_rejects_bad_jobs_value(tmp_path: Path, capsys, jobs):
+    write_bundle(tmp_path, [base_node()])
+    code, out = run_main(tmp_path, capsys, f"--jobs={jobs}")
+    assert code == 2
+    assert "Usage" in out
+
+
+def test_streamed_bundle_matches_batch(tmp_path: Path, monkeypatch, capsys):
+    pytest.importorskip("ijson")
+    fast = base_node()
+    fast["safety"] = {"ndSafe": True, "motionOptIn": True, "minSweepSec": 5, "notes": "too fast"}
+    write_bundle(tmp_path, [base_node(), fast])
+    bundle = tmp_path / "dist" / "codex.min.json"
+
+    monkeypatch.setattr(validator, "STREAM_THRESHOLD_BYTES", 0)
+    assert validator.run_validation(bundle, SCHEMA) == 1
+    streamed = capsys.readouterr().out
+    monkeypatch.setattr(validator, "STREAM_THRESHOLD_BYTES", 1 << 62)
+    assert validator.run_validation(bundle, SCHEMA) == 1
+    assert capsys.readouterr().out == streamed
+    assert "node[1].safety.minSweepSec" in streamed
+
+    for payload in ({"nodes": 3}, [base_node()], "nodes"):
+        bundle.write_text(json.dumps(payload), encoding="utf-8")
+        for threshold in (0, 1 << 62):
+            monkeypatch.setattr(validator, "STREAM_THRESHOLD_BYTES", threshold)
+            assert validator.run_validation(bundle, SCHEMA) == 1
+            assert "missing 'nodes' array" in capsys.readouterr().out
+
+
+def test_type_matches_keeps_bool_out_of_numbers():
+    assert validator.type_matches(3, ["integer"])
+    assert validator.type_matches(2.5, ["number"])
+    assert not validator.type_matches(True, ["integer"])
+    assert not validator.type_matches(False, ["number"])
+    assert validator.type_matches(True, ["integer", "boolean"])
+    assert validator.type_matches(None, ["integer", "null"])
+    assert not validator.type_matches(1.0, ["integer"])